@@ -92,33 +92,17 @@ function FileList({ idToken }) {
         }
       });
 
-      if (response.ok) {
-        const contentType = response.headers.get('content-type');
-        
-        if (contentType && contentType.includes('application/json')) {
-          // Response might be base64 encoded
-          const data = await response.json();
-          // Handle base64 if needed
-          const blob = new Blob([atob(data)], { type: 'application/octet-stream' });
-          const url = window.URL.createObjectURL(blob);
-          const a = document.createElement('a');
-          a.href = url;
-          a.download = fileName;
-          a.click();
-          window.URL.revokeObjectURL(url);
-        } else {
-          const blob = await response.blob();
-          const url = window.URL.createObjectURL(blob);
-          const a = document.createElement('a');
-          a.href = url;
-          a.download = fileName;
-          a.click();
-          window.URL.revokeObjectURL(url);
-        }
-        
+      const data = await response.json();
+
+      if (response.ok && data.url) {
+        // The URL is presigned with an attachment disposition, so navigating saves the file
+        const a = document.createElement('a');
+        a.href = data.url;
+        a.download = fileName;
+        a.click();
         setMessage(`✅ Downloaded ${fileName}`);
       } else {
-        setMessage(`❌ Download failed`);
+        setMessage(`❌ Download failed: ${data.error || 'Unknown error'}`);
       }
     } catch (error) {
       setMessage(`❌ Error: ${error.message}`);
@@ -29,25 +29,15 @@ function FileUpload({ idToken, onUploadSuccess }) {
     setMessage('');
 
     try {
-      // Read file as ArrayBuffer for binary support
-      const fileContent = await selectedFile.arrayBuffer();
-      const base64Content = btoa(
-        new Uint8Array(fileContent).reduce(
-          (data, byte) => data + String.fromCharCode(byte),
-          ''
-        )
-      );
-      
+      // Send the file as raw binary; API Gateway base64-encodes it for Lambda
       const response = await fetch(`${API_ENDPOINT}/upload`, {
         method: 'POST',
         headers: {
           'Authorization': idToken,
           'file-name': selectedFile.name,
-          'Content-Type': 'application/json'
+          'Content-Type': 'application/octet-stream'
         },
-        body: JSON.stringify({
-          file_content: base64Content
-        })
+        body: selectedFile
       });
 
       const data = await response.json();
@@ -1,85 +1,109 @@
 import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
 import json
+import logging
 import os
-import base64
+from functools import lru_cache
 from urllib.parse import unquote
 
-s3 = boto3.client('s3')
+# Built once per container: JSON encoder (orjson when a layer provides it), pooled S3 client, bucket name
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _dumps = json.dumps
+
+logger = logging.getLogger()
+logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
+
+_CFG = Config(max_pool_connections=50, tcp_keepalive=True, retries={'max_attempts': 3, 'mode': 'standard'})
+
+s3 = boto3.client('s3', config=_CFG)
+
+_BUCKET = os.environ.get('BUCKET_NAME')
+
+# unquote is pure, so repeat requests for the same key (retries, polling) hit the cache
+_unquote = lru_cache(maxsize=1024)(unquote)
+
+# Lifetime of the returned download URL; the client uses it immediately
+_URL_EXPIRATION = 300
+
+# Response headers and fixed error bodies
+_CORS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Headers': '*',
+    'Access-Control-Allow-Methods': '*'
+}
+_CORS_JSON = {**_CORS, 'Content-Type': 'application/json'}
+_ERR_NO_BUCKET = _dumps({'error': 'Bucket name environment variable is missing'})
+_ERR_NO_FILE_KEY = _dumps({'error': 'Missing file_key path parameter'})
+_ERR_NOT_FOUND = _dumps({'error': 'File not found'})
 
 def lambda_handler(event, context):
-    print(f"Event: {json.dumps(event)}")
+    # Log only the event shape; never serialize the full payload
+    logger.debug("Event keys=%s body size=%d", list(event.keys()), len(event.get('body') or ''))
     
-    # Retrieve bucket name from environment variable
-    bucket_name = os.environ.get('BUCKET_NAME')
+    # Bucket name from environment variable (read at import)
+    bucket_name = _BUCKET
     
     if not bucket_name:
         return {
             'statusCode': 500,
-            'headers': {
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Headers': '*',
-                'Access-Control-Allow-Methods': '*'
-            },
-            'body': json.dumps({'error': 'Bucket name environment variable is missing'})
+            'headers': _CORS,
+            'body': _ERR_NO_BUCKET
         }
         
     # Assuming API Gateway path parameter
     try:
         file_key = event['pathParameters']['file_key']
         # URL decode the file key (handles spaces and special characters)
-        file_key = unquote(file_key)
-        print(f"File key (decoded): {file_key}")
+        file_key = _unquote(file_key)
+        logger.debug("File key (decoded): %s", file_key)
     except KeyError:
         return {
             'statusCode': 400,
-            'headers': {
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Headers': '*',
-                'Access-Control-Allow-Methods': '*'
-            },
-            'body': json.dumps({'error': 'Missing file_key path parameter'})
+            'headers': _CORS,
+            'body': _ERR_NO_FILE_KEY
         }
 
     try:
-        # Retrieve the file from S3
-        print(f"Attempting to download from bucket: {bucket_name}, key: {file_key}")
-        response = s3.get_object(Bucket=bucket_name, Key=file_key)
-        file_content = response['Body'].read()
-        print(f"Successfully retrieved file, size: {len(file_content)} bytes")
+        # Confirm the file exists (metadata only), then hand the client a presigned URL
+        logger.debug("Attempting to download from bucket: %s, key: %s", bucket_name, file_key)
+        try:
+            s3.head_object(Bucket=bucket_name, Key=file_key)
+        except ClientError as e:
+            # head_object has no body, so a missing key surfaces as a bare 404
+            if e.response['Error']['Code'] != '404':
+                raise
+            logger.info("File not found: %s", file_key)
+            return {
+                'statusCode': 404,
+                'headers': _CORS,
+                'body': _ERR_NOT_FOUND
+            }
 
-        return {
-            'statusCode': 200,
-            'headers': {
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Headers': '*',
-                'Access-Control-Allow-Methods': '*',
-                'Content-Type': 'application/octet-stream',
-                'Content-Disposition': f'attachment; filename="{file_key}"'
+        url = s3.generate_presigned_url('get_object',
+            Params={
+                'Bucket': bucket_name,
+                'Key': file_key,
+                'ResponseContentDisposition': f'attachment; filename="{file_key}"'
             },
-            'body': base64.b64encode(file_content).decode('utf-8'),
-            'isBase64Encoded': True
-        }
-    except s3.exceptions.NoSuchKey:
-        print(f"File not found: {file_key}")
+            ExpiresIn=_URL_EXPIRATION
+        )
+        logger.info("Returning presigned URL for key: %s", file_key)
+
         return {
-            'statusCode': 404,
-            'headers': {
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Headers': '*',
-                'Access-Control-Allow-Methods': '*'
-            },
-            'body': json.dumps({'error': 'File not found'})
+            'statusCode': 200,
+            'headers': _CORS_JSON,
+            'body': _dumps({'url': url})
         }
     except Exception as e:
-        print(f"Error downloading file: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error downloading file: %s", e)
         return {
             'statusCode': 500,
-            'headers': {
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Headers': '*',
-                'Access-Control-Allow-Methods': '*'
-            },
-            'body': json.dumps({'error': str(e)})
+            'headers': _CORS,
+            'body': _dumps({'error': str(e)})
         }
\ No newline at end of file
@@ -1,44 +1,92 @@
 import boto3
+from botocore.config import Config
 import os
 import json 
+import logging
+import time
+from collections import OrderedDict
 from datetime import datetime # No longer strictly needed but okay to keep
 
+# orjson comes from an optional layer; the client and bucket name are reused by warm invocations
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _dumps = json.dumps
+
+logger = logging.getLogger()
+logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
+
+_CFG = Config(max_pool_connections=50, tcp_keepalive=True, retries={'max_attempts': 3, 'mode': 'standard'})
+
+s3_client = boto3.client('s3', config=_CFG)
+
+_BUCKET = os.environ.get('BUCKET_NAME')
+
+# Signed URLs cached per warm container, least recently used first:
+# (bucket, key, expiration) -> (url, expires_at)
+_URL_CACHE = OrderedDict()
+_URL_CACHE_MAX = 1024
+# Re-sign once a cached URL has less than this many seconds left
+_URL_REFRESH_MARGIN = 300
+
+# Response headers and fixed error bodies
+_CORS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Headers': '*',
+    'Access-Control-Allow-Methods': '*'
+}
+_CORS_JSON = {**_CORS, 'Content-Type': 'application/json'}
+_ERR_NO_BUCKET = _dumps({'error': 'Bucket name environment variable is missing'})
+_ERR_NO_FILE_NAME = _dumps({'error': 'file_name query parameter is required'})
+_ERR_PRESIGN_FAILED = _dumps({'error': 'Could not generate presigned URL'})
+
 def generate_presigned_url(bucket_name, object_key, expiration=3600):
-    s3_client = boto3.client('s3')
+    now = time.time()
+    cache_key = (bucket_name, object_key, expiration)
+    cached = _URL_CACHE.get(cache_key)
+    if cached is not None and cached[1] - now > _URL_REFRESH_MARGIN:
+        _URL_CACHE.move_to_end(cache_key)
+        return cached[0]
+
     try:
         response = s3_client.generate_presigned_url('get_object',
             Params={'Bucket': bucket_name, 'Key': object_key},
             ExpiresIn=expiration
         )
     except Exception as e:
-        # Log the error for debugging
-        print(f"Error generating presigned URL for key {object_key}: {e}")
+        logger.exception("Error generating presigned URL for key %s: %s", object_key, e)
         return None
 
+    # Track expiry ourselves; botocore does not expose it on the signed URL
+    _URL_CACHE[cache_key] = (response, now + expiration)
+    _URL_CACHE.move_to_end(cache_key)
+    if len(_URL_CACHE) > _URL_CACHE_MAX:
+        _URL_CACHE.popitem(last=False)
     return response
 
 def lambda_handler(event, context):
     
     # -------------------------------------------------------------
     # 🎯 Cognito Trigger Check (Pre-Sign Up)
-    if 'triggerSource' in event and event['triggerSource'].startswith('PreSignUp_'):
+    # API Gateway events carry no triggerSource, so this is one lookup on the hot path
+    trigger_source = event.get('triggerSource')
+    if trigger_source is not None and trigger_source[:10] == 'PreSignUp_':
         # This is the required pass-through response for Cognito triggers
         return event
     
     # -------------------------------------------------------------
     # API Gateway / Client Invocation Logic
 
-    bucket_name = os.environ.get('BUCKET_NAME') 
+    bucket_name = _BUCKET
     
     if not bucket_name:
         return {
             'statusCode': 500,
-            'headers': {
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Headers': '*',
-                'Access-Control-Allow-Methods': '*'
-            },
-            'body': json.dumps({'error': 'Bucket name environment variable is missing'})
+            'headers': _CORS,
+            'body': _ERR_NO_BUCKET
         }
         
     # Retrieve file_name safely from query string parameters
@@ -48,12 +96,8 @@ def lambda_handler(event, context):
     if not object_key:
         return {
             'statusCode': 400,
-            'headers': {
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Headers': '*',
-                'Access-Control-Allow-Methods': '*'
-            },
-            'body': json.dumps({'error': 'file_name query parameter is required'})
+            'headers': _CORS,
+            'body': _ERR_NO_FILE_NAME
         }
 
     presigned_url = generate_presigned_url(bucket_name, object_key)
@@ -61,22 +105,13 @@ def lambda_handler(event, context):
     if presigned_url is None:
         return {
             'statusCode': 500,
-            'headers': {
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Headers': '*',
-                'Access-Control-Allow-Methods': '*'
-            },
-            'body': json.dumps({'error': 'Could not generate presigned URL'})
+            'headers': _CORS,
+            'body': _ERR_PRESIGN_FAILED
         }
     
     # Return a JSON object containing the URL
     return {
         'statusCode': 200,
-        'headers': {
-            'Access-Control-Allow-Origin': '*',
-            'Access-Control-Allow-Headers': '*',
-            'Access-Control-Allow-Methods': '*',
-            'Content-Type': 'application/json'
-        },
-        'body': json.dumps({'url': presigned_url})
+        'headers': _CORS_JSON,
+        'body': _dumps({'url': presigned_url})
     }
\ No newline at end of file
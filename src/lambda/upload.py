@@ -1,62 +1,105 @@
 import json
+import logging
 import boto3
+from botocore.config import Config
 import base64
 import os
 
-s3_client = boto3.client('s3')
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
+logger = logging.getLogger()
+logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
+
+_CFG = Config(max_pool_connections=50, tcp_keepalive=True, retries={'max_attempts': 3, 'mode': 'standard'})
+
+s3_client = boto3.client('s3', config=_CFG)
+
+# If unset, the handler raises ValueError and the generic except turns it into a 500
+_BUCKET = os.environ.get('BUCKET_NAME')
+
+# Response headers
+_CORS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Headers': '*',
+    'Access-Control-Allow-Methods': '*'
+}
+_CORS_JSON = {**_CORS, 'Content-Type': 'application/json'}
+
+def _get_header(headers, name, title_name):
+    """
+    Case-insensitive header lookup for a lowercase `name`.
+    Tries the usual spellings directly before scanning every header.
+    """
+    value = headers.get(name) or headers.get(title_name)
+    if value is None:
+        value = next((v for k, v in headers.items() if k.lower() == name), None)
+    return value
 
 def lambda_handler(event, context):
     try:
-        print(f"Event: {json.dumps(event)}")
-        bucket_name = os.environ['BUCKET_NAME']
+        # Never serialize the event: the body is the whole (base64) file
+        logger.debug("Event keys=%s body size=%d", list(event.keys()), len(event.get('body') or ''))
+        bucket_name = _BUCKET
+        if not bucket_name:
+            raise ValueError("Bucket name environment variable is missing")
         
         # Get file name from headers (case-insensitive)
-        headers = {k.lower(): v for k, v in event.get('headers', {}).items()}
-        file_name = headers.get('file-name')
+        headers = event.get('headers') or {}
+        file_name = _get_header(headers, 'file-name', 'File-Name')
         
         if not file_name:
             raise ValueError("Missing file-name header")
         
+        # Media types are case-insensitive
+        content_type = (_get_header(headers, 'content-type', 'Content-Type') or '').lower()
+        
         # Check if body is base64 encoded (from API Gateway)
         body_content = event['body']
         if event.get('isBase64Encoded', False):
-            body_content = base64.b64decode(body_content).decode('utf-8')
-        
-        # Parse the JSON body to get base64 content
-        body = json.loads(body_content)
-        base64_content = body['file_content']
-        
-        if not base64_content:
-            raise ValueError("Missing file_content in body")
+            body_content = base64.b64decode(body_content)
+        elif content_type.startswith('application/octet-stream'):
+            # Binary media type not active on the stage: the text body is already mangled
+            raise ValueError("Binary upload was not base64-encoded by API Gateway")
+        elif isinstance(body_content, str):
+            body_content = body_content.encode('utf-8')
         
-        # Decode base64 to binary
-        file_content = base64.b64decode(base64_content)
+        if content_type.startswith('application/json'):
+            # Legacy JSON envelope: {"file_content": "<base64>"}
+            body = _loads(body_content)
+            base64_content = body['file_content']
+            
+            if not base64_content:
+                raise ValueError("Missing file_content in body")
+            
+            # Decode base64 to binary
+            file_content = base64.b64decode(base64_content)
+        else:
+            # Raw binary upload: the request body is the file itself
+            file_content = body_content
 
-        # Upload the file to S3
+        # Upload the file to S3 (API Gateway caps payloads at 6 MB, so multipart never applies)
         s3_client.put_object(Bucket=bucket_name, Key=file_name, Body=file_content)
         
-        print(f"Successfully uploaded {file_name} to {bucket_name}")
+        logger.info("Successfully uploaded %s to %s", file_name, bucket_name)
 
         return {
             'statusCode': 200,
-            'headers': {
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Headers': '*',
-                'Access-Control-Allow-Methods': '*'
-            },
-            'body': json.dumps({'message': 'File uploaded successfully', 'file_name': file_name})
+            'headers': _CORS,
+            'body': _dumps({'message': 'File uploaded successfully', 'file_name': file_name})
         }
     except Exception as e:
-        print(f"Error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error uploading file: %s", e)
         return {
             'statusCode': 500,
-            'headers': {
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Headers': '*',
-                'Access-Control-Allow-Methods': '*',
-                'Content-Type': 'application/json'
-            },
-            'body': json.dumps({'error': str(e)})
+            'headers': _CORS_JSON,
+            'body': _dumps({'error': str(e)})
         }
\ No newline at end of file
@@ -2,6 +2,9 @@
 resource "aws_api_gateway_rest_api" "file_share_api" {
   name        = "FileShareAPI"
   description = "API for file uploading and sharing"
+
+  # Pass raw binary request bodies (file uploads) to Lambda base64-encoded
+  binary_media_types = ["application/octet-stream"]
 }
 
 # --- 2. Cognito Authorizer (Security) ---
@@ -166,9 +169,10 @@ resource "aws_api_gateway_integration" "download_options_integration" {
 resource "aws_api_gateway_deployment" "api_deployment" {
   rest_api_id = aws_api_gateway_rest_api.file_share_api.id
   
-  # Force a redeployment when any method/integration changes
+  # Force a redeployment when any method/integration or binary media type changes
   triggers = {
     redeployment = sha1(jsonencode([
+      aws_api_gateway_rest_api.file_share_api.binary_media_types,
       aws_api_gateway_integration.upload_integration.id,
       aws_api_gateway_integration.download_integration.id,
       aws_api_gateway_integration.presign_integration.id,
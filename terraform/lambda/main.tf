@@ -105,6 +105,7 @@ resource "aws_lambda_function" "upload_function" {
   handler       = "upload.lambda_handler"
   runtime       = "python3.8"
   timeout       = 30
+  layers        = var.lambda_layer_arns
 
   filename         = data.archive_file.upload_zip.output_path
   source_code_hash = data.archive_file.upload_zip.output_base64sha256
@@ -123,6 +124,7 @@ resource "aws_lambda_function" "download_function" {
   handler       = "download.lambda_handler"
   runtime       = "python3.8"
   timeout       = 30
+  layers        = var.lambda_layer_arns
 
   filename         = data.archive_file.download_zip.output_path
   source_code_hash = data.archive_file.download_zip.output_base64sha256
@@ -141,6 +143,7 @@ resource "aws_lambda_function" "presign_function" {
   handler       = "presign.lambda_handler"
   runtime       = "python3.8"
   timeout       = 30
+  layers        = var.lambda_layer_arns
 
   filename         = data.archive_file.presign_zip.output_path
   source_code_hash = data.archive_file.presign_zip.output_base64sha256
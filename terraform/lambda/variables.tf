@@ -14,4 +14,8 @@ variable "cognito_user_pool_id" {
   type        = string
 }
 
-
+variable "lambda_layer_arns" {
+  description = "Optional Lambda layers (e.g. one providing orjson) attached to the API handlers."
+  type        = list(string)
+  default     = []
+}
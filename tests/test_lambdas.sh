@@ -261,14 +261,11 @@ EOF
   
   log_info "Download Lambda returned status 200"
   
-  # Extract and decode body
-  BODY=$(jq -r '.body' "$TEST_DIR/download-output.json")
-  IS_BASE64=$(jq -r '.isBase64Encoded' "$TEST_DIR/download-output.json")
-  
-  if [ "$IS_BASE64" = "true" ]; then
-    DOWNLOAD_CONTENT=$(echo "$BODY" | base64 --decode)
-  else
-    DOWNLOAD_CONTENT="$BODY"
+  # Fetch the file through the returned presigned URL
+  DOWNLOAD_URL=$(jq -r '.body | fromjson | .url' "$TEST_DIR/download-output.json")
+  if ! DOWNLOAD_CONTENT=$(curl -s -f "$DOWNLOAD_URL"); then
+    log_error "Failed to download via presigned URL"
+    exit 1
   fi
   
   if [ "$DOWNLOAD_CONTENT" != "$TEST_CONTENT" ]; then
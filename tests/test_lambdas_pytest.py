@@ -1,8 +1,11 @@
 import os
 import json
+import base64
 import boto3
+from botocore.config import Config
 import pytest
 from datetime import datetime
+from urllib.request import urlopen
 
 # Configuration from environment
 AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
@@ -12,16 +15,28 @@ PRESIGN_FN = os.getenv("PRESIGN_FN", "presign_url_function")
 DOWNLOAD_FN = os.getenv("DOWNLOAD_FN", "download_file_function")
 
 # Initialize clients
-lambda_client = boto3.client("lambda", region_name=AWS_REGION)
 s3_client = boto3.client("s3", region_name=AWS_REGION)
 
-# Test fixtures
-TEST_FILE_NAME = f"test-file-{datetime.now().timestamp()}.txt"
+# Test fixtures (unique per pytest-xdist worker so parallel runs don't collide)
+WORKER_ID = os.getenv("PYTEST_XDIST_WORKER", "main")
+TEST_FILE_NAME = f"test-file-{WORKER_ID}-{datetime.now().timestamp()}.txt"
 TEST_CONTENT = "Hello from pytest Lambda tests"
+# Not valid UTF-8, so any text re-encoding would change it
+TEST_BINARY_CONTENT = b"\x00\xff\xfe\x80binary\x89PNG"
 
 
 @pytest.fixture(scope="session")
-def bucket():
+def lambda_client():
+    """Lambda client shared by the whole session, with warm pooled connections"""
+    return boto3.client(
+        "lambda",
+        region_name=AWS_REGION,
+        config=Config(max_pool_connections=50, tcp_keepalive=True),
+    )
+
+
+@pytest.fixture(scope="session")
+def bucket(lambda_client):
     """Discover or use configured bucket name"""
     global BUCKET_NAME
     if not BUCKET_NAME:
@@ -50,7 +65,7 @@ def cleanup_s3_file(bucket_name, file_name):
 class TestUploadLambda:
     """Tests for the upload Lambda function"""
     
-    def test_upload_success(self, bucket):
+    def test_upload_success(self, lambda_client, bucket):
         """Test successful file upload"""
         payload = {
             "body": TEST_CONTENT,
@@ -79,7 +94,7 @@ class TestUploadLambda:
         finally:
             cleanup_s3_file(bucket, TEST_FILE_NAME)
     
-    def test_upload_missing_file_name(self, bucket):
+    def test_upload_missing_file_name(self, lambda_client, bucket):
         """Test upload fails when file-name header is missing"""
         payload = {
             "body": TEST_CONTENT,
@@ -94,14 +109,97 @@ class TestUploadLambda:
         assert response["StatusCode"] == 200
         result = json.loads(response["Payload"].read())
         assert result["statusCode"] == 500
+    
+    def test_upload_binary_base64(self, lambda_client, bucket):
+        """Test raw binary upload delivered base64-encoded by API Gateway"""
+        file_name = f"{TEST_FILE_NAME}.bin"
+        payload = {
+            "body": base64.b64encode(TEST_BINARY_CONTENT).decode(),
+            "isBase64Encoded": True,
+            "headers": {
+                "file-name": file_name,
+                "content-type": "application/octet-stream"
+            }
+        }
+        
+        response = lambda_client.invoke(
+            FunctionName=UPLOAD_FN,
+            Payload=json.dumps(payload)
+        )
+        
+        assert response["StatusCode"] == 200
+        result = json.loads(response["Payload"].read())
+        assert result["statusCode"] == 200
+        
+        # Verify the exact bytes in S3
+        try:
+            s3_response = s3_client.get_object(Bucket=bucket, Key=file_name)
+            assert s3_response["Body"].read() == TEST_BINARY_CONTENT
+        finally:
+            cleanup_s3_file(bucket, file_name)
+    
+    def test_upload_json_envelope(self, lambda_client, bucket):
+        """Test the {"file_content": <base64>} envelope is still accepted with a JSON content type"""
+        file_name = f"{TEST_FILE_NAME}.json-envelope"
+        payload = {
+            "body": json.dumps({"file_content": base64.b64encode(TEST_BINARY_CONTENT).decode()}),
+            "headers": {
+                "file-name": file_name,
+                "content-type": "application/json"
+            }
+        }
+        
+        response = lambda_client.invoke(
+            FunctionName=UPLOAD_FN,
+            Payload=json.dumps(payload)
+        )
+        
+        assert response["StatusCode"] == 200
+        result = json.loads(response["Payload"].read())
+        assert result["statusCode"] == 200
+        
+        # Verify the decoded file, not the envelope, is in S3
+        try:
+            s3_response = s3_client.get_object(Bucket=bucket, Key=file_name)
+            assert s3_response["Body"].read() == TEST_BINARY_CONTENT
+        finally:
+            cleanup_s3_file(bucket, file_name)
+    
+    def test_upload_binary_not_base64_rejected(self, lambda_client, bucket):
+        """Test an octet-stream body that API Gateway passed as text is rejected"""
+        file_name = f"{TEST_FILE_NAME}.mangled"
+        payload = {
+            "body": TEST_CONTENT,
+            "isBase64Encoded": False,
+            "headers": {
+                "file-name": file_name,
+                "content-type": "application/octet-stream"
+            }
+        }
+        
+        response = lambda_client.invoke(
+            FunctionName=UPLOAD_FN,
+            Payload=json.dumps(payload)
+        )
+        
+        assert response["StatusCode"] == 200
+        result = json.loads(response["Payload"].read())
+        assert result["statusCode"] == 500
+        
+        # Verify nothing was written to S3
+        try:
+            with pytest.raises(s3_client.exceptions.ClientError):
+                s3_client.head_object(Bucket=bucket, Key=file_name)
+        finally:
+            cleanup_s3_file(bucket, file_name)
 
 
 class TestPresignLambda:
     """Tests for the presign Lambda function"""
     
-    @pytest.fixture(autouse=True)
+    @pytest.fixture(scope="class", autouse=True)
     def setup_test_file(self, bucket):
-        """Create a test file in S3 before each test"""
+        """Create the test file in S3 once for the class; these tests only read it"""
         s3_client.put_object(
             Bucket=bucket,
             Key=TEST_FILE_NAME,
@@ -110,7 +208,7 @@ class TestPresignLambda:
         yield
         cleanup_s3_file(bucket, TEST_FILE_NAME)
     
-    def test_presign_success(self, bucket):
+    def test_presign_success(self, lambda_client, bucket):
         """Test successful presigned URL generation"""
         payload = {
             "queryStringParameters": {
@@ -130,7 +228,7 @@ class TestPresignLambda:
         assert "url" in body
         assert "s3.amazonaws.com" in body["url"]
     
-    def test_presign_missing_file_name(self, bucket):
+    def test_presign_missing_file_name(self, lambda_client, bucket):
         """Test presign fails when file_name is missing"""
         payload = {
             "queryStringParameters": {}
@@ -149,9 +247,9 @@ class TestPresignLambda:
 class TestDownloadLambda:
     """Tests for the download Lambda function"""
     
-    @pytest.fixture(autouse=True)
+    @pytest.fixture(scope="class", autouse=True)
     def setup_test_file(self, bucket):
-        """Create a test file in S3 before each test"""
+        """Create the test file in S3 once for the class; these tests only read it"""
         s3_client.put_object(
             Bucket=bucket,
             Key=TEST_FILE_NAME,
@@ -160,7 +258,7 @@ class TestDownloadLambda:
         yield
         cleanup_s3_file(bucket, TEST_FILE_NAME)
     
-    def test_download_success(self, bucket):
+    def test_download_success(self, lambda_client, bucket):
         """Test successful file download"""
         payload = {
             "pathParameters": {
@@ -177,16 +275,13 @@ class TestDownloadLambda:
         result = json.loads(response["Payload"].read())
         assert result["statusCode"] == 200
         
-        # Decode body if base64 encoded
-        body = result["body"]
-        is_base64 = result.get("isBase64Encoded", False)
-        if is_base64:
-            import base64
-            body = base64.b64decode(body).decode()
+        # Fetch the file through the returned presigned S3 URL
+        with urlopen(json.loads(result["body"])["url"]) as s3_response:
+            body = s3_response.read().decode()
         
         assert body == TEST_CONTENT
     
-    def test_download_not_found(self, bucket):
+    def test_download_not_found(self, lambda_client, bucket):
         """Test download fails for non-existent file"""
         payload = {
             "pathParameters": {
@@ -207,7 +302,7 @@ class TestDownloadLambda:
 class TestEndToEndFlow:
     """End-to-end tests combining multiple functions"""
     
-    def test_upload_presign_download_flow(self, bucket):
+    def test_upload_presign_download_flow(self, lambda_client, bucket):
         """Test complete workflow: upload -> presign -> download"""
         # 1. Upload file
         upload_payload = {
@@ -258,12 +353,9 @@ class TestEndToEndFlow:
             download_result = json.loads(download_response["Payload"].read())
             assert download_result["statusCode"] == 200
             
-            # Decode body
-            body = download_result["body"]
-            is_base64 = download_result.get("isBase64Encoded", False)
-            if is_base64:
-                import base64
-                body = base64.b64decode(body).decode()
+            # Fetch via the returned presigned URL
+            with urlopen(json.loads(download_result["body"])["url"]) as s3_response:
+                body = s3_response.read().decode()
             
             assert body == TEST_CONTENT
         